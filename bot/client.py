@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
-import hashlib
-import hmac
+import functools
 import logging
 import os
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
 
+from bot.signing import build_hmac_template, sign_query
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://testnet.binancefuture.com"
 
+# exchangeInfo lists symbols/filters and changes rarely; prices go stale fast.
+EXCHANGE_INFO_TTL = 3600.0
+TICKER_PRICE_TTL = 1.0
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_unsigned(path: str, items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Memoised query-string encoding for unsigned requests.
+
+    Unsigned queries like ticker/exchangeInfo repeat the exact same
+    params, so the encoded path is cached keyed by (path, sorted items).
+    Signed requests can't be cached — they embed a timestamp.
+    """
+    return f"{path}?{urlencode(items)}"
+
 
 class BinanceAPIError(Exception):
     def __init__(self, status_code: int, code: int, message: str) -> None:
@@ -45,78 +62,154 @@ class BinanceClient:
                 "BINANCE_TESTNET_API_SECRET in your .env file."
             )
 
-        self._session = requests.Session()
-        self._session.headers.update({
-            "X-MBX-APIKEY": self.api_key,
-            "Content-Type": "application/x-www-form-urlencoded",
-        })
+        self.recv_window = 5000
+        # TTL caches: value -> (response, time.monotonic() at fetch).
+        self._exinfo_cache: Dict[Optional[str], Tuple[Dict[str, Any], float]] = {}
+        self._price_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        # Symbol filters are effectively static; cached without a TTL.
+        self._filters_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Keyed HMAC template built once; _sign copies it per signature so the
+        # inner/outer key padding is never redone.
+        self._hmac_template = build_hmac_template(self.api_secret)
+
+        # HTTP/2 multiplexes every call over one keep-alive TLS session to
+        # testnet, so burst workloads no longer serialize on a tiny pool.
+        self._session = httpx.Client(
+            http2=True,
+            base_url=self.base_url,
+            headers={
+                "X-MBX-APIKEY": self.api_key,
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
         logger.info("BinanceClient initialised (testnet: %s)", self.base_url)
 
-    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        params["recvWindow"] = 5000
-        params["timestamp"] = int(time.time() * 1000)
-        query = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode(), query.encode(), hashlib.sha256
-        ).hexdigest()
-        params["signature"] = signature
-        return params
-
-    def _request(
-        self, method: str, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True
-    ) -> Dict[str, Any]:
-        url = f"{self.base_url}{path}"
-        params = dict(params or {})
-
-        if signed:
-            self._sign(params)
-
-        logger.debug("→ %s %s  params=%s", method.upper(), url, params)
+    def _sign(self, params: Dict[str, Any]) -> str:
+        """Return the canonical signed query string for *params*."""
+        return sign_query(self._hmac_template, params, self.recv_window)
 
+    def _send(self, method: str, request_path: str, url: str, **kwargs: Any) -> Dict[str, Any]:
         try:
-            resp = self._session.request(method, url, params=params, timeout=15)
-        except requests.ConnectionError as exc:
-            logger.error("Network error: %s", exc)
-            raise ConnectionError(f"Cannot reach {url}: {exc}") from exc
-        except requests.Timeout as exc:
+            resp = self._session.request(method, request_path, **kwargs)
+        except httpx.TimeoutException as exc:
             logger.error("Request timed out: %s", exc)
             raise TimeoutError(f"Request to {url} timed out.") from exc
+        except httpx.TransportError as exc:
+            # Covers connect failures as well as mid-request resets and
+            # protocol errors (ReadError, WriteError, RemoteProtocolError).
+            logger.error("Network error: %s", exc)
+            raise ConnectionError(f"Cannot reach {url}: {exc}") from exc
 
-        logger.debug("← HTTP %s  body=%s", resp.status_code, resp.text[:500])
+        if logger.isEnabledFor(logging.DEBUG):
+            # resp.text decodes the full body; skip it entirely unless
+            # DEBUG is actually on.
+            logger.debug("← HTTP %s  body=%s", resp.status_code, resp.text[:500])
 
         if resp.status_code >= 400:
             try:
-                body = resp.json()
+                body = orjson.loads(resp.content)
                 api_code = body.get("code", resp.status_code)
                 api_msg = body.get("msg", resp.text)
-            except ValueError:
+            except orjson.JSONDecodeError:
                 api_code = resp.status_code
                 api_msg = resp.text
             raise BinanceAPIError(resp.status_code, api_code, api_msg)
 
-        return resp.json()
+        # orjson decodes straight from the raw bytes — no intermediate str
+        # and much faster on large payloads like exchangeInfo/account.
+        return orjson.loads(resp.content)
+
+    def _request_signed(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+        # Copy so _sign's recvWindow/timestamp never leak into the caller's dict.
+        params = dict(params or {})
+
+        # logger.debug defers formatting but not argument evaluation, so
+        # guard the stringification of the params dict explicitly.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s  params=%s", method.upper(), url, params)
+
+        qs = self._sign(params)
+        if method.upper() == "POST":
+            return self._send(method, path, url, content=qs)
+        return self._send(method, f"{path}?{qs}", url)
+
+    def _request_unsigned(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        # Nothing is mutated on this path, so the caller's dict (or None)
+        # is passed through without a defensive copy.
+        url = f"{self.base_url}{path}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s  params=%s", method.upper(), url, params)
+        if params:
+            return self._send(method, _encode_unsigned(path, tuple(sorted(params.items()))), url)
+        return self._send(method, path, url)
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True):
-        return self._request("GET", path, params, signed)
+        if signed:
+            return self._request_signed("GET", path, params)
+        return self._request_unsigned("GET", path, params)
 
     def post(self, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True):
-        return self._request("POST", path, params, signed)
+        if signed:
+            return self._request_signed("POST", path, params)
+        return self._request_unsigned("POST", path, params)
 
     def delete(self, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True):
-        return self._request("DELETE", path, params, signed)
+        if signed:
+            return self._request_signed("DELETE", path, params)
+        return self._request_unsigned("DELETE", path, params)
 
     def server_time(self) -> int:
         data = self.get("/fapi/v1/time", signed=False)
         return data["serverTime"]
 
     def exchange_info(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+        cached = self._exinfo_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < EXCHANGE_INFO_TTL:
+            return cached[0]
         params = {}
         if symbol:
             params["symbol"] = symbol
-        return self.get("/fapi/v1/exchangeInfo", params=params, signed=False)
+        data = self.get("/fapi/v1/exchangeInfo", params=params, signed=False)
+        self._exinfo_cache[symbol] = (data, time.monotonic())
+        return data
+
+    def symbol_filters(self, symbol: str) -> Dict[str, Dict[str, Any]]:
+        """Return *symbol*'s exchange filters keyed by filterType.
+
+        Filters (tick size, step size, ...) are effectively static, so the
+        result is cached per symbol — one exchangeInfo round-trip per
+        symbol per client.
+        """
+        cached = self._filters_cache.get(symbol)
+        if cached is not None:
+            return cached
+        info = self.exchange_info(symbol)
+        for entry in info.get("symbols", []):
+            if entry.get("symbol") == symbol:
+                filters = {f["filterType"]: f for f in entry.get("filters", [])}
+                self._filters_cache[symbol] = filters
+                return filters
+        raise ValueError(f"Unknown symbol '{symbol}'.")
 
     def account_info(self) -> Dict[str, Any]:
         return self.get("/fapi/v2/account")
 
-    def ticker_price(self, symbol: str) -> Dict[str, Any]:
-        return self.get("/fapi/v1/ticker/price", params={"symbol": symbol}, signed=False)
+    def ticker_price(self, symbol: str, max_age: float = TICKER_PRICE_TTL) -> Dict[str, Any]:
+        """Fetch the latest price, serving from cache if younger than *max_age*.
+
+        Pass ``max_age=0`` to force a fresh quote (e.g. right before
+        placing a latency-sensitive order).
+        """
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < max_age:
+            return cached[0]
+        data = self.get("/fapi/v1/ticker/price", params={"symbol": symbol}, signed=False)
+        self._price_cache[symbol] = (data, time.monotonic())
+        return data
@@ -0,0 +1,187 @@
+"""Async Binance Futures Testnet client for concurrent burst orders.
+
+Mirrors :class:`bot.client.BinanceClient` with an ``httpx.AsyncClient``
+over HTTP/2, so a batch of independent orders (e.g. a bracket's entry +
+stop + take-profit) goes out in parallel on one multiplexed connection
+instead of serializing at N x RTT.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+import orjson
+from dotenv import load_dotenv
+
+from bot.client import (
+    BASE_URL,
+    EXCHANGE_INFO_TTL,
+    TICKER_PRICE_TTL,
+    BinanceAPIError,
+    _encode_unsigned,
+)
+from bot.signing import build_hmac_template, sign_query
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+ORDER_PATH = "/fapi/v1/order"
+
+
+class AsyncBinanceClient:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        base_url: str = BASE_URL,
+    ) -> None:
+        self.api_key = api_key or os.getenv("BINANCE_TESTNET_API_KEY", "")
+        self.api_secret = api_secret or os.getenv("BINANCE_TESTNET_API_SECRET", "")
+        self.base_url = base_url.rstrip("/")
+
+        if not self.api_key or not self.api_secret:
+            raise ValueError(
+                "API credentials are missing. Set BINANCE_TESTNET_API_KEY and "
+                "BINANCE_TESTNET_API_SECRET in your .env file."
+            )
+
+        self.recv_window = 5000
+        # TTL caches: value -> (response, time.monotonic() at fetch).
+        self._exinfo_cache: Dict[Optional[str], Tuple[Dict[str, Any], float]] = {}
+        self._price_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._hmac_template = build_hmac_template(self.api_secret)
+
+        self._session = httpx.AsyncClient(
+            http2=True,
+            base_url=self.base_url,
+            headers={
+                "X-MBX-APIKEY": self.api_key,
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        logger.info("AsyncBinanceClient initialised (testnet: %s)", self.base_url)
+
+    async def aclose(self) -> None:
+        await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncBinanceClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _sign(self, params: Dict[str, Any]) -> str:
+        """Return the canonical signed query string for *params*."""
+        return sign_query(self._hmac_template, params, self.recv_window)
+
+    async def _send(self, method: str, request_path: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            resp = await self._session.request(method, request_path, **kwargs)
+        except httpx.TimeoutException as exc:
+            logger.error("Request timed out: %s", exc)
+            raise TimeoutError(f"Request to {url} timed out.") from exc
+        except httpx.TransportError as exc:
+            # Covers connect failures as well as mid-request resets and
+            # protocol errors (ReadError, WriteError, RemoteProtocolError).
+            logger.error("Network error: %s", exc)
+            raise ConnectionError(f"Cannot reach {url}: {exc}") from exc
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("← HTTP %s  body=%s", resp.status_code, resp.text[:500])
+
+        if resp.status_code >= 400:
+            try:
+                body = orjson.loads(resp.content)
+                api_code = body.get("code", resp.status_code)
+                api_msg = body.get("msg", resp.text)
+            except orjson.JSONDecodeError:
+                api_code = resp.status_code
+                api_msg = resp.text
+            raise BinanceAPIError(resp.status_code, api_code, api_msg)
+
+        return orjson.loads(resp.content)
+
+    async def _request_signed(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+        # Copy so _sign's recvWindow/timestamp never leak into the caller's dict.
+        params = dict(params or {})
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s  params=%s", method.upper(), url, params)
+
+        qs = self._sign(params)
+        if method.upper() == "POST":
+            return await self._send(method, path, url, content=qs)
+        return await self._send(method, f"{path}?{qs}", url)
+
+    async def _request_unsigned(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s  params=%s", method.upper(), url, params)
+        if params:
+            return await self._send(method, _encode_unsigned(path, tuple(sorted(params.items()))), url)
+        return await self._send(method, path, url)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True):
+        if signed:
+            return await self._request_signed("GET", path, params)
+        return await self._request_unsigned("GET", path, params)
+
+    async def post(self, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True):
+        if signed:
+            return await self._request_signed("POST", path, params)
+        return await self._request_unsigned("POST", path, params)
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = True):
+        if signed:
+            return await self._request_signed("DELETE", path, params)
+        return await self._request_unsigned("DELETE", path, params)
+
+    async def server_time(self) -> int:
+        data = await self.get("/fapi/v1/time", signed=False)
+        return data["serverTime"]
+
+    async def exchange_info(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+        cached = self._exinfo_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < EXCHANGE_INFO_TTL:
+            return cached[0]
+        params = {}
+        if symbol:
+            params["symbol"] = symbol
+        data = await self.get("/fapi/v1/exchangeInfo", params=params, signed=False)
+        self._exinfo_cache[symbol] = (data, time.monotonic())
+        return data
+
+    async def account_info(self) -> Dict[str, Any]:
+        return await self.get("/fapi/v2/account")
+
+    async def ticker_price(self, symbol: str, max_age: float = TICKER_PRICE_TTL) -> Dict[str, Any]:
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < max_age:
+            return cached[0]
+        data = await self.get("/fapi/v1/ticker/price", params={"symbol": symbol}, signed=False)
+        self._price_cache[symbol] = (data, time.monotonic())
+        return data
+
+    async def place_orders(self, batch: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fire a batch of order-parameter dicts concurrently.
+
+        All requests multiplex over the same HTTP/2 connection; results
+        come back in batch order. The first failing order propagates its
+        exception to the caller.
+        """
+        return list(
+            await asyncio.gather(*(self.post(ORDER_PATH, params=p) for p in batch))
+        )
@@ -1,18 +1,26 @@
 """Logging configuration — dual console (INFO) + rotating file (DEBUG)."""
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "trading_bot.log")
 
 _configured = False
+_listener = None
 
 
 def setup_logging(level: int = logging.DEBUG) -> None:
-    """Initialise root logger. Safe to call multiple times."""
-    global _configured
+    """Initialise root logger. Safe to call multiple times.
+
+    Handlers sit behind a QueueListener running on a background thread,
+    so callers only enqueue a LogRecord instead of paying for console and
+    file writes inline on the request path.
+    """
+    global _configured, _listener
     if _configured:
         return
     _configured = True
@@ -30,13 +38,21 @@ def setup_logging(level: int = logging.DEBUG) -> None:
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
     console.setFormatter(fmt)
-    root.addHandler(console)
 
     file_handler = RotatingFileHandler(
         LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(fmt)
-    root.addHandler(file_handler)
 
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+
+    # respect_handler_level so the console stays at INFO while the file
+    # still receives DEBUG records.
+    _listener = QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
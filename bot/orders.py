@@ -3,19 +3,57 @@
 from __future__ import annotations
 
 import logging
+import sys
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
-from bot.client import BinanceClient
+from bot.client import BinanceAPIError, BinanceClient
+from bot.validators import to_fixed_point
 
 logger = logging.getLogger(__name__)
 
 ORDER_PATH = "/fapi/v1/order"
-TIF_REQUIRED_TYPES = {"LIMIT", "STOP", "TAKE_PROFIT"}
-
-
-def _fmt(d: Decimal) -> str:
-    return f"{d:f}"
+TIF_REQUIRED_TYPES = frozenset(map(sys.intern, ("LIMIT", "STOP", "TAKE_PROFIT")))
+
+
+def _fmt(d: Decimal, step: Optional[Decimal] = None) -> str:
+    """Format a numeric value using integer fixed-point arithmetic.
+
+    The Decimal is converted to (ticks, scale) once; the string itself is
+    built with integer divmod, keeping Decimal's slow __format__ off the
+    order path. When *step* is given (a symbol's stepSize/tickSize), the
+    value must be an exact multiple of it.
+    """
+    ticks, scale = to_fixed_point(d, step)
+    if scale == 1:
+        return str(ticks)
+    # divmod floors toward negative infinity, so format the magnitude and
+    # re-apply the sign to keep negative values exact.
+    sign = "-" if ticks < 0 else ""
+    decimals = len(str(scale)) - 1
+    whole, frac = divmod(abs(ticks), scale)
+    return f"{sign}{whole}.{frac:0{decimals}d}"
+
+
+def _symbol_steps(
+    client: BinanceClient, symbol: str
+) -> tuple[Optional[Decimal], Optional[Decimal]]:
+    """Fetch (stepSize, tickSize) for *symbol*, best-effort.
+
+    The lookup is served from the client's per-symbol cache after the
+    first call. If exchangeInfo cannot be fetched, formatting falls back
+    to the values' own precision and the exchange does the final check.
+    """
+    try:
+        filters = client.symbol_filters(symbol)
+    except (BinanceAPIError, ConnectionError, TimeoutError, ValueError) as exc:
+        logger.warning("Could not fetch exchange filters for %s: %s", symbol, exc)
+        return None, None
+    lot = filters.get("LOT_SIZE")
+    price_filter = filters.get("PRICE_FILTER")
+    step = Decimal(lot["stepSize"]) if lot else None
+    tick = Decimal(price_filter["tickSize"]) if price_filter else None
+    return step, tick
 
 
 def place_order(
@@ -29,17 +67,19 @@ def place_order(
     stop_price: Optional[Decimal] = None,
     time_in_force: str = "GTC",
 ) -> Dict[str, Any]:
+    step, tick = _symbol_steps(client, symbol)
+
     params: Dict[str, Any] = {
         "symbol": symbol,
         "side": side,
         "type": order_type,
-        "quantity": _fmt(quantity),
+        "quantity": _fmt(quantity, step),
     }
 
     if price is not None:
-        params["price"] = _fmt(price)
+        params["price"] = _fmt(price, tick)
     if stop_price is not None:
-        params["stopPrice"] = _fmt(stop_price)
+        params["stopPrice"] = _fmt(stop_price, tick)
     if order_type in TIF_REQUIRED_TYPES:
         params["timeInForce"] = time_in_force
 
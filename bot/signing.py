@@ -0,0 +1,32 @@
+"""Request signing shared by the sync and async Binance clients."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+from typing import Any, Dict
+from urllib.parse import urlencode
+
+
+def build_hmac_template(api_secret: str) -> hmac.HMAC:
+    """Build the keyed HMAC template once; callers copy() it per signature."""
+    return hmac.new(api_secret.encode(), digestmod=hashlib.sha256)
+
+
+def sign_query(template: hmac.HMAC, params: Dict[str, Any], recv_window: int = 5000) -> str:
+    """Return the canonical signed query string for *params*.
+
+    The string is sent verbatim as URL query or form body, so the encoding
+    pass used for signing is the only one — the HTTP layer never
+    re-encodes the parameters. *template* is only ever copied, never
+    mutated, so it is safe to share across calls.
+    """
+    params["recvWindow"] = recv_window
+    # Integer-only ms timestamp: no float multiply, no rounding at the
+    # ms boundary that could trip Binance's recvWindow check.
+    params["timestamp"] = time.time_ns() // 1_000_000
+    query = urlencode(params)
+    h = template.copy()
+    h.update(query.encode())
+    return f"{query}&signature={h.hexdigest()}"
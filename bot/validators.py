@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import sys
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-VALID_SIDES = {"BUY", "SELL"}
-VALID_ORDER_TYPES = {
+# frozensets of interned strings: the membership test degenerates to a
+# pointer comparison for interned inputs, and the immutability is explicit.
+VALID_SIDES = frozenset(map(sys.intern, ("BUY", "SELL")))
+VALID_ORDER_TYPES = frozenset(map(sys.intern, (
     "MARKET", "LIMIT", "STOP", "STOP_MARKET",
     "TAKE_PROFIT", "TAKE_PROFIT_MARKET",
-}
-PRICE_REQUIRED_TYPES = {"LIMIT", "STOP", "TAKE_PROFIT"}
-STOP_REQUIRED_TYPES = {"STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET"}
+)))
+PRICE_REQUIRED_TYPES = frozenset(map(sys.intern, ("LIMIT", "STOP", "TAKE_PROFIT")))
+STOP_REQUIRED_TYPES = frozenset(map(sys.intern, (
+    "STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET",
+)))
 
 
+# The string validators are pure (same input -> same output or raise), so
+# memoising them is safe; interactive sessions re-validate the same few
+# strings over and over. Raising calls are not cached by lru_cache.
+@functools.lru_cache(maxsize=256)
 def validate_symbol(symbol: str) -> str:
     symbol = symbol.strip().upper()
     if not symbol or not symbol.isalpha():
@@ -27,15 +37,17 @@ def validate_symbol(symbol: str) -> str:
     return symbol
 
 
+@functools.lru_cache(maxsize=16)
 def validate_side(side: str) -> str:
-    side = side.strip().upper()
+    side = sys.intern(side.strip().upper())
     if side not in VALID_SIDES:
-        raise ValueError(f"Invalid side '{side}'. Must be one of {VALID_SIDES}.")
+        raise ValueError(f"Invalid side '{side}'. Must be one of {', '.join(sorted(VALID_SIDES))}.")
     return side
 
 
+@functools.lru_cache(maxsize=32)
 def validate_order_type(order_type: str) -> str:
-    order_type = order_type.strip().upper()
+    order_type = sys.intern(order_type.strip().upper())
     if order_type not in VALID_ORDER_TYPES:
         raise ValueError(
             f"Invalid order type '{order_type}'. Supported: {', '.join(sorted(VALID_ORDER_TYPES))}."
@@ -43,6 +55,32 @@ def validate_order_type(order_type: str) -> str:
     return order_type
 
 
+def to_fixed_point(value: Decimal, step: Optional[Decimal] = None) -> Tuple[int, int]:
+    """Convert a validated Decimal to ``(ticks, scale)`` with ``value == ticks / scale``.
+
+    The scale is a power of ten. When *step* is given (e.g. a symbol's
+    tickSize/stepSize from exchange filters), the step's precision is used
+    and *value* must be an exact multiple of it. Downstream formatting can
+    then use pure integer arithmetic instead of Decimal.
+    """
+    if step is not None:
+        # Binance filter strings carry trailing zeros ("0.00100000");
+        # normalising keeps the derived precision minimal.
+        step = step.normalize()
+    exponent = -(step if step is not None else value.normalize()).as_tuple().exponent
+    if exponent < 0:
+        exponent = 0
+    scale = 10 ** exponent
+    ticks = value.scaleb(exponent)
+    if ticks != ticks.to_integral_value():
+        raise ValueError(f"Value {value} is not a multiple of step {step}.")
+    if step is not None:
+        step_ticks = int(step.scaleb(exponent))
+        if step_ticks and int(ticks) % step_ticks:
+            raise ValueError(f"Value {value} is not a multiple of step {step}.")
+    return int(ticks), scale
+
+
 def validate_quantity(quantity: str | float) -> Decimal:
     try:
         qty = Decimal(str(quantity))
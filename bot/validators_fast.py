@@ -0,0 +1,71 @@
+"""Vectorised numeric validation for bulk order flows (e.g. CSV batches).
+
+The scalar validators in :mod:`bot.validators` are fine for interactive
+use, but a bulk mode validating thousands of rows should not pay
+per-value Decimal construction. This module checks a whole float64 array
+in one compiled pass and returns a mask of valid rows; only rows that
+will actually be sent need the Decimal formatting path.
+
+numpy is required for this module (it is not needed anywhere else in the
+bot); numba is optional — without it the check falls back to a plain
+numpy expression, which is still vectorised.
+"""
+
+from __future__ import annotations
+
+import logging
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on install set
+    raise ImportError(
+        "numpy is required for bulk validation. Install it with "
+        "'pip install numpy' (and optionally numba for the compiled path)."
+    ) from exc
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _check_positive_py(arr: np.ndarray) -> np.ndarray:
+    return (arr > 0.0) & np.isfinite(arr)
+
+
+if njit is not None:
+    # Explicit signature + cache=True compiles ahead of first use and
+    # persists the machine code on disk, so CLI invocations don't pay
+    # JIT latency.
+    @njit("boolean[:](float64[:])", cache=True)
+    def _check_positive(arr):  # pragma: no cover - compiled
+        out = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            out[i] = (v > 0.0) and (v == v) and (v != np.inf)
+        return out
+else:
+    _check_positive = _check_positive_py
+
+
+def validate_quantities_bulk(quantities: np.ndarray) -> np.ndarray:
+    """Return a boolean mask marking which quantities are valid (> 0, finite).
+
+    Accepts anything convertible to a contiguous float64 array. Invalid
+    rows are reported in the mask rather than raised, so callers can
+    skip or collect them in one pass.
+    """
+    arr = np.ascontiguousarray(quantities, dtype=np.float64)
+    mask = _check_positive(arr)
+    invalid = int(arr.shape[0] - int(mask.sum()))
+    if invalid:
+        logger.debug("Bulk validation: %d of %d quantities invalid", invalid, arr.shape[0])
+    return mask
+
+
+def validate_prices_bulk(prices: np.ndarray) -> np.ndarray:
+    """Same contract as :func:`validate_quantities_bulk`, for prices."""
+    arr = np.ascontiguousarray(prices, dtype=np.float64)
+    return _check_positive(arr)
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
 import click
 from colorama import Fore, Style, init as colorama_init
@@ -24,33 +25,56 @@ colorama_init(autoreset=True)
 setup_logging()
 logger = logging.getLogger(__name__)
 
+_client: Optional[BinanceClient] = None
+
+# Colored fragments used on every redraw, built once at import.
+_HR = "─" * 44
+_HR_YELLOW = f"{Fore.YELLOW}{_HR}"
+_OK_PREFIX = f"{Fore.GREEN}✔ "
+_ERR_PREFIX = f"{Fore.RED}✖ "
+_INFO_PREFIX = f"{Fore.CYAN}ℹ "
+_BANNER_BAR = "=" * 50
+_MENU_HEADER = f"{Fore.YELLOW}Choose an action:{Style.RESET_ALL}"
+
+
+def _get_client() -> BinanceClient:
+    """Return the shared client, creating it on first use.
+
+    Reusing one client keeps the keep-alive connection pool warm, so every
+    operation after the first skips the TCP+TLS handshake.
+    """
+    global _client
+    if _client is None:
+        _client = BinanceClient()
+    return _client
+
 
 
 def _success(msg: str) -> None:
-    click.echo(f"{Fore.GREEN}✔ {msg}{Style.RESET_ALL}")
+    click.echo(_OK_PREFIX + msg + Style.RESET_ALL)
 
 
 def _error(msg: str) -> None:
-    click.echo(f"{Fore.RED}✖ {msg}{Style.RESET_ALL}")
+    click.echo(_ERR_PREFIX + msg + Style.RESET_ALL)
 
 
 def _info(msg: str) -> None:
-    click.echo(f"{Fore.CYAN}ℹ {msg}{Style.RESET_ALL}")
+    click.echo(_INFO_PREFIX + msg + Style.RESET_ALL)
 
 
 def _print_request_summary(
     symbol: str, side: str, order_type: str, quantity, price, stop_price
 ) -> None:
-    click.echo(f"\n{Fore.YELLOW}{'─' * 44}")
-    click.echo(f"  ORDER REQUEST SUMMARY")
-    click.echo(f"{'─' * 44}{Style.RESET_ALL}")
+    click.echo("\n" + _HR_YELLOW)
+    click.echo("  ORDER REQUEST SUMMARY")
+    click.echo(_HR + Style.RESET_ALL)
     click.echo(f"  Symbol      : {symbol}")
     click.echo(f"  Side        : {side}")
     click.echo(f"  Type        : {order_type}")
     click.echo(f"  Quantity    : {quantity}")
     click.echo(f"  Price       : {price or 'MARKET'}")
     click.echo(f"  Stop Price  : {stop_price or 'N/A'}")
-    click.echo(f"{Fore.YELLOW}{'─' * 44}{Style.RESET_ALL}\n")
+    click.echo(_HR_YELLOW + Style.RESET_ALL + "\n")
 
 
 
@@ -82,7 +106,7 @@ def order(symbol, side, order_type, quantity, price, stop_price):
 def price(symbol):
     """Fetch the current price for a symbol."""
     try:
-        client = BinanceClient()
+        client = _get_client()
         symbol = validate_symbol(symbol)
         data = client.ticker_price(symbol)
         _success(f"{data['symbol']} = {data['price']}")
@@ -96,7 +120,7 @@ def price(symbol):
 def account():
     """Show testnet account balances."""
     try:
-        client = BinanceClient()
+        client = _get_client()
         info = client.account_info()
         click.echo(f"\n{Fore.CYAN}Account Balances (non-zero):{Style.RESET_ALL}")
         for asset in info.get("assets", []):
@@ -125,7 +149,7 @@ def _execute_order(symbol, side, order_type, quantity, price, stop_price):
     _print_request_summary(symbol, side, order_type, qty, validated_price, validated_stop)
 
     try:
-        client = BinanceClient()
+        client = _get_client()
         resp = place_order(
             client,
             symbol=symbol,
@@ -137,6 +161,10 @@ def _execute_order(symbol, side, order_type, quantity, price, stop_price):
         )
         click.echo(format_order_response(resp))
         _success("Order placed successfully!")
+    except ValueError as exc:
+        # e.g. quantity/price not a multiple of the symbol's step/tick size.
+        _error(f"Validation error: {exc}")
+        logger.warning("Order validation failed: %s", exc)
     except BinanceAPIError as exc:
         _error(f"Binance API error: {exc}")
         logger.error("API error: %s", exc)
@@ -149,12 +177,12 @@ def _execute_order(symbol, side, order_type, quantity, price, stop_price):
 
 
 def interactive_menu():
-    click.echo(f"\n{Fore.CYAN}{'=' * 50}")
+    click.echo(f"\n{Fore.CYAN}{_BANNER_BAR}")
     click.echo("   PrimeTrade AI – Binance Futures Testnet Bot")
-    click.echo(f"{'=' * 50}{Style.RESET_ALL}\n")
+    click.echo(_BANNER_BAR + Style.RESET_ALL + "\n")
 
     while True:
-        click.echo(f"{Fore.YELLOW}Choose an action:{Style.RESET_ALL}")
+        click.echo(_MENU_HEADER)
         click.echo("  1) Place an order")
         click.echo("  2) Check price")
         click.echo("  3) View account balances")
@@ -204,7 +232,7 @@ def _interactive_order():
 def _interactive_price():
     symbol = click.prompt("  Symbol", default="BTCUSDT")
     try:
-        client = BinanceClient()
+        client = _get_client()
         s = validate_symbol(symbol)
         data = client.ticker_price(s)
         _success(f"{data['symbol']} = {data['price']}")
@@ -214,7 +242,7 @@ def _interactive_price():
 
 def _interactive_account():
     try:
-        client = BinanceClient()
+        client = _get_client()
         info = client.account_info()
         click.echo(f"\n{Fore.CYAN}  Account Balances (non-zero):{Style.RESET_ALL}")
         for asset in info.get("assets", []):